@@ -247,11 +247,13 @@ class QueuedLaunch(models.Model):
     @transaction.atomic
     def refresh_from_scheduler(cls):
         from balsam.service.schedulers import scheduler
-        saved_jobs = list(cls.objects.all())
-        saved_job_ids = [j.scheduler_id for j in saved_jobs]
+        saved_jobs = {}
+        for j in cls.objects.all():
+            saved_jobs.setdefault(j.scheduler_id, j)
         stats = scheduler.status_dict()
         for job_id, job in stats.items():
-            if job_id not in saved_job_ids:
+            saved_job = saved_jobs.get(job_id)
+            if saved_job is None:
                 j = cls(scheduler_id=job_id,
                         project=job['project'],
                         queue=job['queue'],
@@ -263,7 +265,6 @@ class QueuedLaunch(models.Model):
                 j.save()
                 logger.info(f'Detected new job: {j}')
             else:
-                saved_job = saved_jobs[saved_job_ids.index(job_id)]
                 if job['state'] != saved_job.state:
                     logger.info(f'Updating batch job {job_id}: state {job["state"]}')
                 saved_job.state = job['state']
@@ -273,7 +274,7 @@ class QueuedLaunch(models.Model):
                 saved_job.wall_minutes = job['wall_time_min']
                 saved_job.command = job['command']
                 saved_job.save()
-        delete_ids = [id for id in saved_job_ids if id not in stats.keys()]
+        delete_ids = [id for id in saved_jobs if id not in stats]
         cls.objects.filter(scheduler_id__in=delete_ids).delete()
         if delete_ids:
             logger.info(f'Deleting Jobs {delete_ids} no longer in scheduler')
@@ -22,6 +22,8 @@ logger.setLevel(logging.DEBUG)
 # - GridFTP implementation
 GRIDFTP_PROTOCOL='gsiftp'
 class GridFTPHandler:
+   follows_symlinks = False
+
    def pre_stage_hook(self):
       # check to see if proxy already exists
       p = subprocess.Popen([settings.GRIDFTP_PROXY_INFO,'-exists'])
@@ -101,6 +103,8 @@ class GridFTPHandler:
 # - Local implementation
 LOCAL_PROTOCOL='local'
 class LocalHandler:
+   follows_symlinks = True
+
    def pre_stage_hook(self):
       pass
 
@@ -129,7 +133,7 @@ class LocalHandler:
       dest = validate_path(dest)
       assert os.path.isdir(dest), f'{dest} is not a valid destination directory'
 
-      command = f'cp -r {source} {dest}'
+      command = f'cp -r -L {source} {dest}'
       logger.debug('transfer.stage_out: command=' + command )
       p = subprocess.Popen(command,stdout=subprocess.PIPE,stderr=subprocess.STDOUT,
               shell=True)
@@ -140,6 +144,8 @@ class LocalHandler:
 # - SCP implementation
 SCP_PROTOCOL='scp'
 class SCPHandler:
+   follows_symlinks = True
+
    def pre_stage_hook(self):
       pass
 
@@ -186,3 +192,7 @@ def stage_out(source_directory, destination_url):
     handler = get_handler(destination_url)
     handler.pre_stage_hook()
     handler.stage_out(source_directory, destination_url)
+
+def follows_symlinks(destination_url):
+    '''True if stage_out to destination_url copies symlink targets'''
+    return get_handler(destination_url).follows_symlinks
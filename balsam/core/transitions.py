@@ -11,18 +11,18 @@ status queue. These transition processes explicitly ignore SIGINT and SIGTERM
 interrupts, so that they can finish the current transition and exit gracefully,
 under control of the main Launcher process.
 '''
-from collections import defaultdict
+import fnmatch
 import glob
 import multiprocessing
 import os
-from io import StringIO
-from traceback import print_exc
+from traceback import format_exc
 import random
 import signal
 import shutil
 import subprocess
 import time
 import tempfile
+from uuid import UUID
 from setproctitle import setproctitle
 
 from django import db
@@ -39,7 +39,12 @@ logger = logging.getLogger(__name__)
 JOBCACHE_LIMIT = 1000
 PREPROCESS_TIMEOUT_SECONDS = 300
 POSTPROCESS_TIMEOUT_SECONDS = 300
+POSTPROCESS_REFRESH_FIELDS = ['state', 'stage_out_url', 'stage_out_files']
 EXIT_FLAG = False
+_KEEP_STATES = frozenset(PROCESSABLE_STATES) - {'AWAITING_PARENTS'}
+_CHECK_PARENT_STATES = frozenset({'CREATED', 'AWAITING_PARENTS'})
+_PARENT_LOOKUP_STATES = _CHECK_PARENT_STATES | {'READY'}
+_FAILED_PARENT_STATES = frozenset({'FAILED', 'USER_KILLED'})
 
 
 class BalsamTransitionError(Exception): pass
@@ -57,7 +62,7 @@ class TransitionProcessPool:
             target=main, args=(i, num_threads, wf_name),
             name=self.__class__.__name__+str(i))
                       for i in range(num_threads)]
-        logger.info(f"Starting {len(self.procs)} transition processes")
+        logger.info("Starting %d transition processes", len(self.procs))
         db.connections.close_all()
         for proc in self.procs:
             proc.daemon = True
@@ -86,15 +91,19 @@ def fail_update(failed_jobs):
 
 def update_states_from_cache(job_cache):
     # Update states of fast-forwarded jobs
-    update_jobs = defaultdict(list)
+    changed = [job for job in job_cache if job.state != job.__old_state]
+    if not changed:
+        return
+
+    update_jobs = {}
     failed_jobs = []
-    for job in job_cache:
-        if job.state != job.__old_state:
-            job.__old_state = job.state
-            if job.state != 'FAILED':
-                update_jobs[job.state].append(job.pk)
-            else:
-                failed_jobs.append(job)
+    for job in changed:
+        state = job.state
+        job.__old_state = state
+        if state != 'FAILED':
+            update_jobs.setdefault(state, []).append(job.pk)
+        else:
+            failed_jobs.append(job)
 
     if failed_jobs:
         fail_update(failed_jobs)
@@ -102,7 +111,7 @@ def update_states_from_cache(job_cache):
         BalsamJob.batch_update_state(joblist, newstate)
 
 
-def select_range(num_threads, thread_idx):
+def select_range(num_threads, thread_idx, manager):
     HEX_DIGITS = '0123456789abcdef'
     chunk, rem = divmod(len(HEX_DIGITS), num_threads)
     start, end = thread_idx*chunk, (thread_idx+1)*chunk
@@ -110,48 +119,48 @@ def select_range(num_threads, thread_idx):
     if thread_idx < rem:
         my_digits += HEX_DIGITS[thread_idx-rem]
 
-    manager = BalsamJob.source
     processable = manager.by_states(PROCESSABLE_STATES).filter(lock='')
     processable = processable.order_by('-state') # put AWAITING_PARENTS last to avoid starvation
-    logger.debug(f"There are {processable.count()} processable jobs")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("There are %d processable jobs", processable.count())
     if num_threads == 1:
         qs = processable
     else:
         qs = processable.annotate(first_pk_char=Substr(Cast('pk', CharField(max_length=36)) , 1, 1))
         qs = qs.filter(first_pk_char__in=my_digits)
     qs = qs.values_list('pk', flat=True)[:JOBCACHE_LIMIT]
-    logger.debug(f"TransitionThread{thread_idx} select:\n{qs.query}")
+    logger.debug("TransitionThread%d select:\n%s", thread_idx, qs.query)
     return list(qs)
 
 
-def refresh_cache(job_cache, num_threads, thread_idx):
-    manager = BalsamJob.source
-    to_acquire = select_range(num_threads, thread_idx)
-    logger.debug(f"TransitionThread{thread_idx} will try to acquire: {[str(id)[:8] for id in to_acquire]}")
+def refresh_cache(job_cache, num_threads, thread_idx, manager):
+    to_acquire = select_range(num_threads, thread_idx, manager)
+    logger.debug("TransitionThread%d will try to acquire: %s", thread_idx,
+                 [str(id)[:8] for id in to_acquire])
     acquired = manager.acquire(to_acquire)
 
     if len(acquired) <  len(to_acquire):
         st = random.random()
         time.sleep(st)
-        logger.debug(f"failed to acquire {len(to_acquire)}; only got {len(acquired)}")
+        logger.debug("failed to acquire %d; only got %d", len(to_acquire), len(acquired))
     if acquired:
-        logger.debug(f'Acquired {len(acquired)} new jobs')
-        acquired = BalsamJob.objects.filter(pk__in=acquired)
+        logger.debug("Acquired %d new jobs", len(acquired))
+        acquired = list(BalsamJob.objects.filter(pk__in=acquired))
+        for job in acquired:
+            job.__old_state = job.state
         job_cache.extend(acquired)
-    for job in job_cache:
-        job.__old_state = job.state
 
 
-def release_jobs(job_cache):
-    manager = BalsamJob.source
-    release_jobs = [
-        j.pk for j in job_cache if
-        (j.state not in PROCESSABLE_STATES)
-        or (j.state == 'AWAITING_PARENTS')
-    ]
-    if release_jobs:
-        manager.release(release_jobs)
-    return [j for j in job_cache if j.pk not in release_jobs]
+def release_jobs(job_cache, manager):
+    keep, release = [], []
+    for job in job_cache:
+        if job.state in _KEEP_STATES:
+            keep.append(job)
+        else:
+            release.append(job.pk)
+    if release:
+        manager.release(release)
+    return keep
 
 
 def main(thread_idx, num_threads, wf_name):
@@ -162,16 +171,15 @@ def main(thread_idx, num_threads, wf_name):
     manager = BalsamJob.source
     manager.workflow = wf_name
     random.seed(multiprocessing.current_process().pid)
-    time.sleep(random.random())
+    # Stagger process startup to de-synchronize initial DB access
+    time.sleep(thread_idx * 0.5 / max(num_threads, 1))
     manager.start_tick()
     setproctitle(multiprocessing.current_process().name)
 
     try:
         _main(thread_idx, num_threads)
     except:
-        buf = StringIO()
-        print_exc(file=buf)
-        logger.critical(f"Uncaught exception:\n%s", buf.getvalue())
+        logger.critical("Uncaught exception", exc_info=True)
     finally:
         manager.release_all_owned()
         logger.debug('Transition process finished: released all jobs')
@@ -180,137 +188,157 @@ def main(thread_idx, num_threads, wf_name):
 def _main(thread_idx, num_threads):
     global EXIT_FLAG
     manager = BalsamJob.source
+    transitions = TRANSITIONS
+    time_time = time.time
     job_cache = []
     last_refresh = 0
     refresh_period = 5
 
     while not EXIT_FLAG:
         # Update in-memory cache of locked BalsamJobs
-        elapsed = time.time() - last_refresh
+        elapsed = time_time() - last_refresh
         if elapsed > refresh_period:
             if len(job_cache) < JOBCACHE_LIMIT:
-                refresh_cache(job_cache, num_threads, thread_idx)
-            last_refresh = time.time()
+                refresh_cache(job_cache, num_threads, thread_idx, manager)
+            last_refresh = time_time()
         else:
             time.sleep(1)
 
         # Fast-forward transitions & release locks
         fast_forward(job_cache)
-        job_cache = release_jobs(job_cache)
+        update_states_from_cache(job_cache)
+        job_cache = release_jobs(job_cache, manager)
 
         # Run transitions (one pass over all jobs)
         for job in job_cache:
-            transition_function = TRANSITIONS[job.state]
+            transition_function = transitions[job.state]
             try:
                 transition_function(job)
-            except BalsamTransitionError as e:
+            except BalsamTransitionError:
                 job.state = 'FAILED'
-                buf = StringIO()
-                print_exc(file=buf)
-                job.__fail_msg = buf.getvalue()
-                logger.exception(f"Marking {job.cute_id} as FAILED")
+                job.__fail_msg = format_exc()
+                logger.exception("Marking %s as FAILED", job.cute_id)
             if EXIT_FLAG:
                 break
         # Update states in bulk
         update_states_from_cache(job_cache)
-        job_cache = release_jobs(job_cache)
+        job_cache = release_jobs(job_cache, manager)
     logger.info('EXIT_FLAG: exiting main loop')
 
 
-def check_parents(job):
+def fetch_parent_states(parent_ids):
+    '''Look up the states of parent_ids in one query'''
+    if not parent_ids:
+        return {}
+    qs = BalsamJob.objects.filter(job_id__in=parent_ids).values_list('job_id', 'state')
+    return {str(pk): state for pk, state in qs}
+
+
+def check_parents(job, parent_ids=None, parent_states=None):
     '''Check job's dependencies, update to READY if satisfied'''
-    num_parents = len(job.get_parents_by_id())
+    if parent_ids is None:
+        parent_ids = job.get_parents_by_id()
+    num_parents = len(parent_ids)
 
     if num_parents == 0 or not job.wait_for_parents:
         ready = True
     else:
-        parents = job.get_parents()
-        ready = num_parents == parents.filter(state='JOB_FINISHED').count()
+        parent_ids = [str(UUID(pid)) for pid in parent_ids]
+        if parent_states is None:
+            parent_states = fetch_parent_states(parent_ids)
+        # Same test as comparing the parent count against a COUNT of finished rows
+        finished = {pid for pid in parent_ids if parent_states.get(pid) == 'JOB_FINISHED'}
+        ready = len(finished) == num_parents
 
     if ready:
         job.state = 'READY'
-        logger.debug(f'{job.cute_id} ready')
+        logger.debug("%s ready", job.cute_id)
     elif job.state != 'AWAITING_PARENTS':
         job.state = 'AWAITING_PARENTS'
-        logger.info(f'{job.cute_id} waiting for {num_parents} parents')
-    elif parents.filter(state__in=['FAILED', 'USER_KILLED']).exists():
+        logger.info("%s waiting for %d parents", job.cute_id, num_parents)
+    elif any(parent_states.get(pid) in _FAILED_PARENT_STATES for pid in parent_ids):
         job.state = 'FAILED'
         job.__fail_msg = 'One or more parent jobs failed'
 
 
 def fast_forward(job_cache):
-    '''Make several passes over the job list; advancing states in order'''
-    # Check parents
-    check_jobs = (j for j in job_cache if j.state in 'CREATED AWAITING_PARENTS'.split())
-    for job in check_jobs: check_parents(job)
-
-    # Skip stage-in
-    stagein_jobs = (j for j in job_cache if j.state == 'READY')
-    for job in stagein_jobs:
-        workdir = job.working_directory
-        if not os.path.exists(workdir):
-            os.makedirs(workdir)
-            logger.info(f"{job.cute_id} created working directory {workdir}")
-        hasParents = bool(job.get_parents_by_id())
-        hasInput = bool(job.input_files)
-        hasRemote = bool(job.stage_in_url)
-        if not hasRemote and not (hasParents and hasInput): job.state = 'STAGED_IN'
-
-    # Skip preprocess
-    preprocess_jobs = (j for j in job_cache if j.state == 'STAGED_IN')
-    for job in preprocess_jobs:
-        if not job.preprocess:
-            job.state = 'PREPROCESSED'
-
-    # RUN_DONE: skip postprocess
-    done_jobs = (j for j in job_cache if j.state=='RUN_DONE' and not j.postprocess)
-    for job in done_jobs:
-        job.state = 'POSTPROCESSED'
+    '''Make a single pass over the job list; advancing each job's state in order'''
+    # Parse parent lists once; they are needed to check parents and to skip stage-in
+    parents = {job.pk: job.get_parents_by_id() for job in job_cache
+               if job.state in _PARENT_LOOKUP_STATES}
+    wait_ids = {pid for job in job_cache
+                if job.state in _CHECK_PARENT_STATES and job.wait_for_parents
+                for pid in parents[job.pk]}
+    parent_states = fetch_parent_states(wait_ids)
 
-    # Timeout: retry
-    retry_jobs = (j for j in job_cache if j.state=='RUN_TIMEOUT'
-                  and j.auto_timeout_retry and not j.post_timeout_handler)
-    for job in retry_jobs:
-        job.state = 'RESTART_READY'
-
-    # Timeout: fail
-    timefail_jobs = (j for j in job_cache if j.state=='RUN_TIMEOUT'
-                     and not j.auto_timeout_retry
-                     and not (j.postprocess and j.post_timeout_handler)
-                    )
-    for job in timefail_jobs:
-        job.state = 'FAILED'
+    for job in job_cache:
+        # Check parents
+        if job.state in _CHECK_PARENT_STATES:
+            check_parents(job, parents[job.pk], parent_states)
+        state = job.state
+
+        # Skip stage-in
+        if state == 'READY':
+            workdir = job.working_directory
+            try:
+                os.makedirs(workdir)
+            except FileExistsError:
+                pass
+            else:
+                logger.info("%s created working directory %s", job.cute_id, workdir)
+            hasParents = bool(parents[job.pk])
+            hasInput = bool(job.input_files)
+            hasRemote = bool(job.stage_in_url)
+            if not hasRemote and not (hasParents and hasInput):
+                state = job.state = 'STAGED_IN'
+
+        # Skip preprocess
+        if state == 'STAGED_IN':
+            if not job.preprocess:
+                state = job.state = 'PREPROCESSED'
+
+        # RUN_DONE: skip postprocess
+        elif state == 'RUN_DONE':
+            if not job.postprocess:
+                state = job.state = 'POSTPROCESSED'
+
+        elif state == 'RUN_TIMEOUT':
+            # Timeout: retry
+            if job.auto_timeout_retry and not job.post_timeout_handler:
+                job.state = 'RESTART_READY'
+            # Timeout: fail
+            elif (not job.auto_timeout_retry
+                  and not (job.postprocess and job.post_timeout_handler)):
+                job.state = 'FAILED'
 
-    # Error: fail
-    errfail_jobs = (j for j in job_cache if j.state=='RUN_ERROR'
-                    and not (j.post_error_handler and j.postprocess)
-                   )
-    for job in errfail_jobs:
-        job.state = 'FAILED'
+        # Error: fail
+        elif state == 'RUN_ERROR':
+            if not (job.post_error_handler and job.postprocess):
+                job.state = 'FAILED'
 
-    # skip stageout (finished)
-    stageout_jobs = (j for j in job_cache if j.state=='POSTPROCESSED'
-                     and not (j.stage_out_url and j.stage_out_files)
-                    )
-    for job in stageout_jobs:
-        job.state = 'JOB_FINISHED'
-    update_states_from_cache(job_cache)
+        # skip stageout (finished)
+        if state == 'POSTPROCESSED':
+            if not (job.stage_out_url and job.stage_out_files):
+                job.state = 'JOB_FINISHED'
 
 
 def stage_in(job):
-    logger.debug(f'{job.cute_id} in stage_in')
+    logger.debug("%s in stage_in", job.cute_id)
 
     work_dir = job.working_directory
-    if not os.path.exists(work_dir):
+    try:
         os.makedirs(work_dir)
-        logger.debug(f"{job.cute_id} working directory {work_dir}")
+    except FileExistsError:
+        pass
+    else:
+        logger.debug("%s working directory %s", job.cute_id, work_dir)
 
     # stage in all remote urls
     # TODO: stage_in remote transfer should allow a list of files and folders,
     # rather than copying just one entire folder
     url_in = job.stage_in_url
     if url_in:
-        logger.info(f"{job.cute_id} transfer in from {url_in}")
+        logger.info("%s transfer in from %s", job.cute_id, url_in)
         try:
             transfer.stage_in(f"{url_in}",  f"{work_dir}")
         except Exception as e:
@@ -322,72 +350,102 @@ def stage_in(job):
     matches = []
     parents = job.get_parents()
     input_patterns = job.input_files.split()
-    logger.debug(f"{job.cute_id} searching parent workdirs for {input_patterns}")
+    logger.debug("%s searching parent workdirs for %s", job.cute_id, input_patterns)
+    path_join = os.path.join
     for parent in parents:
-        parent_dir = parent.working_directory
+        parent_pk, parent_dir = parent.pk, parent.working_directory
         for pattern in input_patterns:
-            path = os.path.join(parent_dir, pattern)
-            matches.extend((parent.pk, match)
-                           for match in glob.glob(path))
+            matches.extend((parent_pk, match)
+                           for match in glob.iglob(path_join(parent_dir, pattern)))
 
+    basename, symlink = os.path.basename, os.symlink
     for parent_pk, inp_file in matches:
-        basename = os.path.basename(inp_file)
-        new_path = os.path.join(work_dir, basename)
+        new_path = path_join(work_dir, basename(inp_file))
 
-        if os.path.exists(new_path):
-            new_path += f"_{str(parent_pk)[:8]}"
-        # pointing to src, named dst
-        logger.info(f"{job.cute_id}   {new_path}  -->  {inp_file}")
+        # pointing to src, named dst; disambiguate with the parent pk on collision
         try:
-            os.symlink(src=inp_file, dst=new_path)
+            try:
+                symlink(src=inp_file, dst=new_path)
+            except FileExistsError:
+                new_path += f"_{str(parent_pk)[:8]}"
+                symlink(src=inp_file, dst=new_path)
         except FileExistsError:
-            logger.warning(f"Symlink at {new_path} already exists; skipping creation")
+            logger.warning("Symlink at %s already exists; skipping creation", new_path)
         except Exception as e:
             raise BalsamTransitionError(
                 f"Exception received during symlink: {e}") from e
+        else:
+            logger.info("%s   %s  -->  %s", job.cute_id, new_path, inp_file)
 
     job.state = 'STAGED_IN'
-    logger.debug(f"{job.cute_id} stage_in done")
+    logger.debug("%s stage_in done", job.cute_id)
+
+
+def match_workdir_files(work_dir, patterns):
+    '''Glob patterns in work_dir, reading the directory only once when no
+    pattern descends into a subdirectory'''
+    if any(os.sep in pattern for pattern in patterns):
+        matches = []
+        for pattern in patterns:
+            matches.extend(glob.glob(os.path.join(work_dir, pattern)))
+        return matches
+
+    try:
+        with os.scandir(work_dir) as it:
+            names = [entry.name for entry in it]
+    except FileNotFoundError:
+        return []
+    # Like glob, only match hidden files with patterns that start with a dot
+    visible = [name for name in names if not name.startswith('.')]
+    matches = []
+    for pattern in patterns:
+        candidates = names if pattern.startswith('.') else visible
+        matches.extend(os.path.join(work_dir, name)
+                       for name in fnmatch.filter(candidates, pattern))
+    return matches
 
 
 def stage_out(job):
     '''copy from the local working_directory to the output_url '''
-    logger.debug(f'{job.cute_id} in stage_out')
+    logger.debug("%s in stage_out", job.cute_id)
 
     url_out = job.stage_out_url
     if not url_out:
         job.state = 'JOB_FINISHED'
-        logger.debug(f'{job.cute_id} no stage_out_url: done')
+        logger.debug("%s no stage_out_url: done", job.cute_id)
         return
 
     stage_out_patterns = job.stage_out_files.split()
-    logger.debug(f"{job.cute_id} stage out files match: {stage_out_patterns}")
+    logger.debug("%s stage out files match: %s", job.cute_id, stage_out_patterns)
     work_dir = job.working_directory
-    matches = []
-    for pattern in stage_out_patterns:
-        path = os.path.join(work_dir, pattern)
-        matches.extend(glob.glob(path))
+    matches = match_workdir_files(work_dir, stage_out_patterns)
 
     if matches:
-        logger.info(f"{job.cute_id} stage out files: {matches}")
+        logger.info("%s stage out files: %s", job.cute_id, matches)
         with tempfile.TemporaryDirectory() as stagingdir:
             try:
-                for f in matches:
+                # Link instead of copy when the transfer dereferences symlinks
+                stage_file = os.symlink if transfer.follows_symlinks(url_out) else shutil.copyfile
+                # Overlapping patterns can match the same file more than once
+                for f in dict.fromkeys(matches):
                     base = os.path.basename(f)
                     dst = os.path.join(stagingdir, base)
-                    shutil.copyfile(src=f, dst=dst)
-                    logger.info(f"staging {f} out for transfer")
-                logger.info(f"transferring to {url_out}")
+                    # A later match with the same basename replaces the earlier one
+                    if os.path.lexists(dst):
+                        os.remove(dst)
+                    stage_file(os.path.abspath(f), dst)
+                    logger.info("staging %s out for transfer", f)
+                logger.info("transferring to %s", url_out)
                 transfer.stage_out(f"{stagingdir}/*", f"{url_out}/")
             except Exception as e:
                 message = f'Exception received during stage_out: {e}'
                 raise BalsamTransitionError(message) from e
     job.state = 'JOB_FINISHED'
-    logger.debug(f'{job.cute_id} stage_out done')
+    logger.debug("%s stage_out done", job.cute_id)
 
 
 def preprocess(job):
-    logger.debug(f'{job.cute_id} in preprocess')
+    logger.debug("%s in preprocess", job.cute_id)
 
     # Get preprocesser exe
     preproc_app = job.preprocess
@@ -395,7 +453,8 @@ def preprocess(job):
         job.state = 'PREPROCESSED'
         return
 
-    if not os.path.exists(preproc_app.split()[0]):
+    args = preproc_app.split()
+    if not os.path.exists(args[0]):
         # TODO: look for preproc in the EXE directories
         message = f"Preprocessor {preproc_app} does not exist on filesystem"
         raise BalsamTransitionError(message)
@@ -409,20 +468,15 @@ def preprocess(job):
         fp.write(f"# Balsam Preprocessor: {preproc_app}")
         fp.flush()
         try:
-            args = preproc_app.split()
-            logger.info(f"{job.cute_id} preprocess Popen {args}")
-            proc = subprocess.Popen(args, stdout=fp,
-                                    stderr=subprocess.STDOUT, env=envs,
-                                    cwd=job.working_directory,
-                                    )
-            retcode = proc.wait(timeout=PREPROCESS_TIMEOUT_SECONDS)
-            proc.communicate()
+            logger.info("%s preprocess run %s", job.cute_id, args)
+            retcode = subprocess.run(args, stdout=fp,
+                                     stderr=subprocess.STDOUT, env=envs,
+                                     cwd=job.working_directory,
+                                     timeout=PREPROCESS_TIMEOUT_SECONDS,
+                                     check=False,
+                                     ).returncode
         except Exception as e:
             message = f"Preprocess failed: {e}"
-            try:
-                proc.kill()
-            except:
-                pass
             raise BalsamTransitionError(message) from e
 
     if retcode != 0:
@@ -431,17 +485,17 @@ def preprocess(job):
         raise BalsamTransitionError(message)
 
     job.state = 'PREPROCESSED'
-    logger.debug(f"{job.cute_id} preprocess done")
+    logger.debug("%s preprocess done", job.cute_id)
 
 
 def postprocess(job, *, error_handling=False, timeout_handling=False):
-    logger.debug(f'{job.cute_id} in postprocess')
+    logger.debug("%s in postprocess", job.cute_id)
     if error_handling and timeout_handling:
         raise ValueError("Both error-handling and timeout-handling is invalid")
     if error_handling:
-        logger.info(f'{job.cute_id} handling RUN_ERROR')
+        logger.info("%s handling RUN_ERROR", job.cute_id)
     if timeout_handling:
-        logger.info(f'{job.cute_id} handling RUN_TIMEOUT')
+        logger.info("%s handling RUN_TIMEOUT", job.cute_id)
 
     # Get postprocesser exe
     postproc_app = job.postprocess
@@ -453,14 +507,15 @@ def postprocess(job, *, error_handling=False, timeout_handling=False):
             raise BalsamTransitionError(message)
         elif timeout_handling:
             job.state = 'RESTART_READY'
-            logger.warning(f'{job.cute_id} unhandled job timeout: marked RESTART_READY')
+            logger.warning("%s unhandled job timeout: marked RESTART_READY", job.cute_id)
             return
         else:
-            job.state = 'POSTPROCESSED',
-            logger.debug(f'{job.cute_id} no postprocess: skipped')
+            job.state = 'POSTPROCESSED'
+            logger.debug("%s no postprocess: skipped", job.cute_id)
             return
 
-    if not os.path.exists(postproc_app.split()[0]):
+    args = postproc_app.split()
+    if not os.path.exists(args[0]):
         # TODO: look for postproc in the EXE directories
         message = f"Postprocessor {postproc_app} does not exist on filesystem"
         raise BalsamTransitionError(message)
@@ -479,20 +534,15 @@ def postprocess(job, *, error_handling=False, timeout_handling=False):
         fp.flush()
 
         try:
-            args = postproc_app.split()
-            logger.info(f"{job.cute_id} postprocess Popen {args}")
-            proc = subprocess.Popen(args, stdout=fp,
-                                    stderr=subprocess.STDOUT, env=envs,
-                                    cwd=job.working_directory,
-                                    )
-            retcode = proc.wait(timeout=POSTPROCESS_TIMEOUT_SECONDS)
-            proc.communicate()
+            logger.info("%s postprocess run %s", job.cute_id, args)
+            retcode = subprocess.run(args, stdout=fp,
+                                     stderr=subprocess.STDOUT, env=envs,
+                                     cwd=job.working_directory,
+                                     timeout=POSTPROCESS_TIMEOUT_SECONDS,
+                                     check=False,
+                                     ).returncode
         except Exception as e:
             message = f"Postprocess failed: {e}"
-            try:
-                proc.kill()
-            except:
-                pass
             raise BalsamTransitionError(message) from e
 
     if retcode != 0:
@@ -500,9 +550,13 @@ def postprocess(job, *, error_handling=False, timeout_handling=False):
         message = f"{job.cute_id} postprocess returned {retcode}:\n{tail}"
         raise BalsamTransitionError(message)
 
-    job.refresh_from_db()
     # If postprocessor handled error or timeout, it should have changed job's
     # state. If it failed to do this, mark FAILED.  Otherwise, POSTPROCESSED.
+    # A normal postprocess only needs the fields read by the later transitions.
+    if error_handling or timeout_handling:
+        job.refresh_from_db()
+    else:
+        job.refresh_from_db(fields=POSTPROCESS_REFRESH_FIELDS)
     if error_handling and job.state == 'RUN_ERROR':
         message = f"{job.cute_id} Error handling didn't fix job state: marking FAILED"
         raise BalsamTransitionError(message)
@@ -516,12 +570,12 @@ def postprocess(job, *, error_handling=False, timeout_handling=False):
     # FAILED, and you override it with POSTPROCESSED, breaking the workflow.
     if job.state == 'RUN_DONE':
         job.state = 'POSTPROCESSED'
-    logger.debug(f"{job.cute_id} postprocess done")
+    logger.debug("%s postprocess done", job.cute_id)
 
 
 def handle_timeout(job):
     if job.post_timeout_handler:
-        logger.debug(f'{job.cute_id} invoking postprocess with timeout_handling flag')
+        logger.debug("%s invoking postprocess with timeout_handling flag", job.cute_id)
         postprocess(job, timeout_handling=True)
     else:
         raise BalsamTransitionError(f"{job.cute_id} no timeout handling: marking FAILED")
@@ -529,7 +583,7 @@ def handle_timeout(job):
 
 def handle_run_error(job):
     if job.post_error_handler:
-        logger.debug(f'{job.cute_id} invoking postprocess with error_handling flag')
+        logger.debug("%s invoking postprocess with error_handling flag", job.cute_id)
         postprocess(job, error_handling=True)
     else:
         raise BalsamTransitionError("No error handler: run failed")
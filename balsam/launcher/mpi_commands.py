@@ -8,6 +8,9 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+THETA_AFFINITIES = frozenset({'depth', 'none'})
+
+
 class BalsamRunnerException(Exception): pass
 
 
@@ -26,13 +29,14 @@ class MPICommand(object):
         self.cpu_binding = None
         self.threads_per_rank = None
         self.threads_per_core = None
+        self._prefix = f"{self.mpi} {self.nproc} "
 
     def worker_str(self, workers):
         return ""
 
     def env_str(self, envs):
-        envstrs = (f'{self.env} {var}="{val}"' for var, val in envs.items())
-        return " ".join(envstrs)
+        env = self.env
+        return " ".join([f'{env} {var}="{val}"' for var, val in envs.items()])
 
     def threads(self, cpu_affinity, thread_per_rank, thread_per_core):
         return ""
@@ -41,14 +45,11 @@ class MPICommand(object):
                  envs, cpu_affinity, threads_per_rank=1, threads_per_core=1,
                  mpi_flags=''):
         '''Build the mpirun/aprun/runjob command line string'''
-        workers = self.worker_str(workers)
-        envs = self.env_str(envs)
         thread_str = self.threads(cpu_affinity, threads_per_rank,
                                   threads_per_core)
-        result = (f"{self.mpi} {self.nproc} {num_ranks} {self.ppn} "
-                  f"{ranks_per_node} {envs} {workers} {thread_str} "
-                  f"{mpi_flags} {app_cmd}")
-        return result
+        return (f"{self._prefix}{num_ranks} {self.ppn} {ranks_per_node} "
+                f"{self.env_str(envs)} {self.worker_str(workers)} "
+                f"{thread_str} {mpi_flags} {app_cmd}")
 
 
 class OpenMPICommand(MPICommand):
@@ -61,29 +62,7 @@ class OpenMPICommand(MPICommand):
         self.cpu_binding = None
         self.threads_per_rank = None
         self.threads_per_core = None
-
-    def worker_str(self, workers):
-        return ""
-
-    def env_str(self, envs):
-        envstrs = (f'{self.env} {var}="{val}"' for var, val in envs.items())
-        return " ".join(envstrs)
-
-    def threads(self, cpu_affinity, thread_per_rank, thread_per_core):
-        return ""
-
-    def __call__(self, workers, *, app_cmd, num_ranks, ranks_per_node, envs,
-                 cpu_affinity, threads_per_rank=1, threads_per_core=1,
-                 mpi_flags=''):
-        '''Build the mpirun/aprun/runjob command line string'''
-        workers = self.worker_str(workers)
-        envs = self.env_str(envs)
-        thread_str = self.threads(cpu_affinity, threads_per_rank,
-                                  threads_per_core)
-        result = (f"{self.mpi} {self.nproc} {num_ranks} {self.ppn} "
-                  f"{ranks_per_node} {envs} {workers} {thread_str} "
-                  f"{mpi_flags} {app_cmd}")
-        return result
+        self._prefix = f"{self.mpi} {self.nproc} "
 
 class ThetaGpuMPICommand(OpenMPICommand):
     '''Single node OpenMPI: ppn == num_ranks'''
@@ -96,6 +75,7 @@ class ThetaGpuMPICommand(OpenMPICommand):
         self.cpu_binding = None
         self.threads_per_rank = None
         self.threads_per_core = None
+        self._prefix = f"{self.mpi} {self.nproc} "
 
     def worker_str(self, workers):
         node_str = ",".join(str(worker.id) for worker in workers)
@@ -106,25 +86,11 @@ class ThetaGpuMPICommand(OpenMPICommand):
         for k,v in os.environ.items():
             if "balsam" in k.lower():
                 envs.setdefault(k, v)
-        envstrs = (f'{self.env} {var}="{val}"' for var, val in envs.items())
-        return " ".join(envstrs)
+        return super().env_str(envs)
 
     def threads(self, cpu_affinity, thread_per_rank, thread_per_core):
         return "--oversubscribe --bind-to none"
 
-    def __call__(self, workers, *, app_cmd, num_ranks, ranks_per_node, envs,
-                 cpu_affinity, threads_per_rank=1, threads_per_core=1,
-                 mpi_flags=''):
-        '''Build the mpirun/aprun/runjob command line string'''
-        workers = self.worker_str(workers)
-        envs = self.env_str(envs)
-        thread_str = self.threads(cpu_affinity, threads_per_rank,
-                                  threads_per_core)
-        result = (f"{self.mpi} {self.nproc} {num_ranks} {self.ppn} "
-                  f"{ranks_per_node} {envs} {workers} {thread_str} "
-                  f"{mpi_flags} {app_cmd}")
-        return result
-
 
 class BGQMPICommand(MPICommand):
     def __init__(self):
@@ -135,6 +101,7 @@ class BGQMPICommand(MPICommand):
         self.cpu_binding = None
         self.threads_per_rank = None
         self.threads_per_core = None
+        self._prefix = f"{self.mpi} {self.nproc} "
 
     def worker_str(self, workers):
         if len(workers) != 1:
@@ -154,9 +121,10 @@ class ThetaMPICommand(MPICommand):
         self.cpu_binding = '-cc'
         self.threads_per_rank = '-d'
         self.threads_per_core = '-j'
+        self._prefix = f"{self.mpi} {self.nproc} "
 
     def threads(self, affinity, thread_per_rank, thread_per_core):
-        assert affinity in 'depth none'.split()
+        assert affinity in THETA_AFFINITIES
         result = f"{self.cpu_binding} {affinity} "
         if affinity == 'depth':
             assert thread_per_rank >= 1 and thread_per_core >= 1
@@ -180,6 +148,7 @@ class MPICHCommand(MPICommand):
         self.cpu_binding = None
         self.threads_per_rank = None
         self.threads_per_core = None
+        self._prefix = f"{self.mpi} {self.nproc} "
 
     def worker_str(self, workers):
         return ""
@@ -195,6 +164,7 @@ class CooleyMPICommand(MPICommand):
         self.cpu_binding = None
         self.threads_per_rank = None
         self.threads_per_core = None
+        self._prefix = f"{self.mpi} {self.nproc} "
 
     def worker_str(self, workers):
         if not workers:
@@ -212,6 +182,7 @@ class SlurmMPICommand(MPICommand):
         self.cpu_binding = None
         self.threads_per_rank = None
         self.threads_per_core = None
+        self._prefix = f"{self.mpi} {self.nproc} "
 
     def env_str(self, envs):
         return ''
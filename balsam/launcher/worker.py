@@ -119,7 +119,7 @@ class WorkerGroup:
             lo = int(lo)
             if hi:
                 hi = int(hi[0])
-                node_ids.extend(list(range(lo, hi+1)))
+                node_ids.extend(range(lo, hi+1))
             else:
                 node_ids.append(lo)
         for id in node_ids:
@@ -1,12 +1,23 @@
 import os
+import re
 from getpass import getuser
-from datetime import datetime
 from django.conf import settings
 from balsam.service.schedulers import Scheduler
 
 import logging
 logger = logging.getLogger(__name__)
 
+HMS_PATTERN = re.compile(r'(\d+):(\d+):(\d+)$')
+
+
+def parse_cobalt_time_seconds(t_str):
+    '''Seconds in a qstat HH:MM:SS string, or None for N/A, etc.'''
+    match = HMS_PATTERN.match(t_str)
+    if match is None:
+        return None
+    hours, minutes, seconds = match.groups()
+    return (int(hours)*60 + int(minutes))*60 + int(seconds)
+
 
 def new_scheduler():
     return CobaltScheduler()
@@ -29,6 +40,12 @@ class CobaltScheduler(Scheduler.Scheduler):
         'project' : 'Project',
         'command' : 'Command',
     }
+    # One whitespace-delimited token per JOBSTATUS_VARIABLES column; the last
+    # column (Command) keeps the rest of the line, including any spaces
+    JOBSTATUS_LINE = re.compile(
+        r'\s*' + r'\s+'.join([r'(\S+)'] * (len(JOBSTATUS_VARIABLES) - 1))
+        + r'\s+(\S.*?)\s*$')
+    JOBSTATUS_TIME_FIELDS = [name for name in JOBSTATUS_VARIABLES if 'time' in name]
     QSTAT_EXE = settings.SCHEDULER_STATUS_EXE
 
     def _make_submit_cmd(self, script_path):
@@ -38,22 +55,19 @@ class CobaltScheduler(Scheduler.Scheduler):
         basename = os.path.splitext(basename)[0]
         return f"{exe} --cwd {cwd} -O {basename} {script_path}"
 
-    def _parse_submit_output(self, submit_output):
-        try:
-            scheduler_id = int(submit_output)
-        except ValueError:
-            scheduler_id = int(submit_output.split()[-1])
-        return scheduler_id
-
     def _make_status_cmd(self):
+        return [self.QSTAT_EXE, '-u', getuser()]
+
+    def _make_status_env(self):
         fields = self.JOBSTATUS_VARIABLES.values()
-        cmd = "QSTAT_HEADER=" + ':'.join(fields)
-        cmd += f" {self.QSTAT_EXE} -u {getuser()}"
-        return cmd
+        return dict(os.environ, QSTAT_HEADER=':'.join(fields))
 
     def _parse_status_output(self, raw_output):
         status_dict = {}
-        job_lines = raw_output.split('\n')[2:]
+        job_lines = iter(raw_output.splitlines())
+        # Skip the header lines
+        next(job_lines, None)
+        next(job_lines, None)
         for line in job_lines:
             job_stat = self._parse_job_line(line)
             if job_stat:
@@ -62,22 +76,14 @@ class CobaltScheduler(Scheduler.Scheduler):
         return status_dict
 
     def _parse_job_line(self, line):
-        fields = line.split()
-        num_expected = len(self.JOBSTATUS_VARIABLES)
-        if len(fields) != num_expected:
+        match = self.JOBSTATUS_LINE.match(line)
+        if match is None:
             return {}
-        stat = {}
-        for i, field_name in enumerate(self.JOBSTATUS_VARIABLES.keys()):
-            stat[field_name] = fields[i]
-            if 'time' in field_name:
-                try:
-                    t = datetime.strptime(fields[i], '%H:%M:%S')
-                except:
-                    pass
-                else:
-                    tsec = t.hour*3600 + t.minute*60 + t.second
-                    stat[field_name+"_sec"] = tsec
-                    tmin = t.hour*60 + t.minute
-                    stat[field_name+"_min"] = tmin
-        logger.debug(str(stat))
+        stat = dict(zip(self.JOBSTATUS_VARIABLES, match.groups()))
+        for field_name in self.JOBSTATUS_TIME_FIELDS:
+            tsec = parse_cobalt_time_seconds(stat[field_name])
+            if tsec is not None:
+                stat[field_name+"_sec"] = tsec
+                stat[field_name+"_min"] = tsec // 60
+        logger.debug("%s", stat)
         return stat
@@ -46,7 +46,7 @@ class JobEnvironment:
 
         if self.current_scheduler_id:
             self.current_scheduler_id = int(self.current_scheduler_id)
-            logger.debug(f"Detected scheduler ID {self.current_scheduler_id}")
+            logger.debug("Detected scheduler ID %s", self.current_scheduler_id)
 
     def remaining_time_seconds(self):
         '''Either counts down from RemainingTime obtained from scheduler, or infinity'''
@@ -11,7 +11,7 @@ class Scheduler:
     JOBSTATUS_VARIABLES = {}
 
     def __init__(self):
-        logger.debug(f"Using scheduler class {self.__class__}")
+        logger.debug("Using scheduler class %s", self.__class__)
 
     def submit(self, script_path):
         submit_cmd = self._make_submit_cmd(script_path)
@@ -22,15 +22,28 @@ class Scheduler:
         scheduler_id = self._parse_submit_output(p.stdout)
         return scheduler_id
 
+    def _parse_submit_output(self, submit_output):
+        # The job id is the last token, whether or not other output precedes it
+        return int(submit_output.rsplit(None, 1)[-1])
+
     def _status(self):
         stat_cmd = self._make_status_cmd()
-        p = subprocess.run(stat_cmd, stdout=subprocess.PIPE, shell=True,
-                           stderr=subprocess.STDOUT, encoding='utf-8')
+        # Without a shell, a missing status exe raises instead of exiting 127
+        try:
+            p = subprocess.run(stat_cmd, stdout=subprocess.PIPE,
+                               env=self._make_status_env(),
+                               stderr=subprocess.STDOUT, encoding='utf-8')
+        except OSError as e:
+            raise StatusNonZeroReturnCode(str(e)) from e
         if p.returncode != 0:
             raise StatusNonZeroReturnCode(p.stdout)
         statinfo = self._parse_status_output(p.stdout)
         return statinfo
 
+    def _make_status_env(self):
+        '''Environment for the status command; None inherits os.environ'''
+        return None
+
     def get_status(self, scheduler_id):
         scheduler_id = int(scheduler_id)
         try:
@@ -1,11 +1,24 @@
 import os
+import re
 from getpass import getuser
-from dateutil.parser import parse as parse_time
 from django.conf import settings
 from balsam.service.schedulers import Scheduler
 import logging
 logger = logging.getLogger(__name__)
 
+# squeue time format: [days-][hours:]minutes:seconds
+SLURM_TIME_PATTERN = re.compile(r'(?:(\d+)-)?(?:(\d+):)?(\d+):(\d+)$')
+
+
+def parse_slurm_time_seconds(t_str):
+    '''Seconds in a squeue time string, or None for UNLIMITED, INVALID, etc.'''
+    match = SLURM_TIME_PATTERN.match(t_str)
+    if match is None:
+        return None
+    days, hours, minutes, seconds = match.groups()
+    hours = int(days or 0)*24 + int(hours or 0)
+    return (hours*60 + int(minutes))*60 + int(seconds)
+
 
 def new_scheduler():
     return SlurmScheduler()
@@ -27,6 +40,7 @@ class SlurmScheduler(Scheduler.Scheduler):
         'project': 'account',
         'command': 'command',
     }
+    JOBSTATUS_TIME_FIELDS = [name for name in JOBSTATUS_VARIABLES if 'time' in name]
 
     def _make_submit_cmd(self, script_path):
         cwd = settings.SERVICE_PATH
@@ -34,22 +48,16 @@ class SlurmScheduler(Scheduler.Scheduler):
         basename = os.path.splitext(basename)[0]
         return f"sbatch --chdir {cwd} --job-name {basename} -o {basename}.out {script_path}"
 
-    def _parse_submit_output(self, submit_output):
-        try:
-            scheduler_id = int(submit_output)
-        except ValueError:
-            scheduler_id = int(submit_output.split()[-1])
-        return scheduler_id
-
     def _make_status_cmd(self):
         fields = self.JOBSTATUS_VARIABLES.values()
         fmt = ' '.join(fields)
-        cmd = f'squeue -u {getuser()} -O "{fmt}"'
-        return cmd
+        return ['squeue', '-u', getuser(), '-O', fmt]
 
     def _parse_status_output(self, raw_output):
         status_dict = {}
-        job_lines = raw_output.split('\n')[1:]
+        job_lines = iter(raw_output.splitlines())
+        # Skip the header line
+        next(job_lines, None)
         for line in job_lines:
             job_stat = self._parse_job_line(line)
             if job_stat:
@@ -58,22 +66,16 @@ class SlurmScheduler(Scheduler.Scheduler):
         return status_dict
 
     def _parse_job_line(self, line):
-        fields = line.split()
         num_expected = len(self.JOBSTATUS_VARIABLES)
+        # The last column (command) keeps the rest of the line
+        fields = line.rstrip().split(None, num_expected - 1)
         if len(fields) != num_expected:
             return {}
-        stat = {}
-        for i, field_name in enumerate(self.JOBSTATUS_VARIABLES.keys()):
-            stat[field_name] = fields[i]
-            if 'time' in field_name:
-                try:
-                    t = parse_time(fields[i])
-                except:
-                    pass
-                else:
-                    tsec = t.hour*3600 + t.minute*60 + t.second
-                    stat[field_name+"_sec"] = tsec
-                    tmin = t.hour*60 + t.minute
-                    stat[field_name+"_min"] = tmin
-        logger.debug(str(stat))
+        stat = dict(zip(self.JOBSTATUS_VARIABLES, fields))
+        for field_name in self.JOBSTATUS_TIME_FIELDS:
+            tsec = parse_slurm_time_seconds(stat[field_name])
+            if tsec is not None:
+                stat[field_name+"_sec"] = tsec
+                stat[field_name+"_min"] = tsec // 60
+        logger.debug("%s", stat)
         return stat
@@ -0,0 +1,118 @@
+import unittest
+
+from balsam.service.schedulers.CobaltScheduler import (
+    CobaltScheduler, parse_cobalt_time_seconds)
+from balsam.service.schedulers.exceptions import (
+    StatusNonZeroReturnCode, NoQStatInformation)
+from balsam.service.schedulers.SlurmScheduler import (
+    SlurmScheduler, parse_slurm_time_seconds)
+
+
+class SlurmTimeTests(unittest.TestCase):
+    def test_minutes_seconds(self):
+        '''MM:SS is minutes and seconds, not hours and minutes'''
+        self.assertEqual(parse_slurm_time_seconds('5:30'), 5*60 + 30)
+
+    def test_hours(self):
+        self.assertEqual(parse_slurm_time_seconds('48:00:00'), 48*3600)
+        self.assertEqual(parse_slurm_time_seconds('1:02:03'), 3600 + 2*60 + 3)
+
+    def test_days(self):
+        self.assertEqual(parse_slurm_time_seconds('1-00:00:00'), 24*3600)
+        self.assertEqual(parse_slurm_time_seconds('2-03:04:05'),
+                         2*86400 + 3*3600 + 4*60 + 5)
+
+    def test_not_a_time(self):
+        self.assertIsNone(parse_slurm_time_seconds('UNLIMITED'))
+        self.assertIsNone(parse_slurm_time_seconds('INVALID'))
+
+
+class SlurmStatusTests(unittest.TestCase):
+    def setUp(self):
+        self.scheduler = SlurmScheduler()
+
+    def test_parse_status_output(self):
+        '''Time columns are converted and the command keeps its spaces'''
+        raw_output = (
+            "JOBID  TIME_LEFT  TIME_LIMIT  STATE  PARTITION  NODES  ACCOUNT  COMMAND\n"
+            "1001   5:30       1-00:00:00  RUNNING  debug  2  proj  /bin/app --in a.txt\n"
+            "1002   UNLIMITED  UNLIMITED   PENDING  debug  1  proj  job.sh\n"
+        )
+        statuses = self.scheduler._parse_status_output(raw_output)
+        self.assertEqual(sorted(statuses), [1001, 1002])
+
+        stat = statuses[1001]
+        self.assertEqual(stat['command'], '/bin/app --in a.txt')
+        self.assertEqual(stat['time_remaining_sec'], 330)
+        self.assertEqual(stat['time_remaining_min'], 5)
+        self.assertEqual(stat['wall_time_sec'], 86400)
+        self.assertEqual(stat['wall_time_min'], 1440)
+
+        stat = statuses[1002]
+        self.assertEqual(stat['state'], 'PENDING')
+        self.assertNotIn('wall_time_sec', stat)
+
+
+class CobaltTimeTests(unittest.TestCase):
+    def test_hours(self):
+        self.assertEqual(parse_cobalt_time_seconds('00:30:00'), 30*60)
+        self.assertEqual(parse_cobalt_time_seconds('48:00:00'), 48*3600)
+
+    def test_not_a_time(self):
+        self.assertIsNone(parse_cobalt_time_seconds('N/A'))
+        self.assertIsNone(parse_cobalt_time_seconds('5:30'))
+
+
+class CobaltStatusTests(unittest.TestCase):
+    def setUp(self):
+        self.scheduler = CobaltScheduler()
+
+    def test_parse_job_line(self):
+        '''Walltimes of 24 hours or more are parsed; the command keeps its spaces'''
+        line = "123456  47:59:30  48:00:00  running  default  128  myproj  /bin/app --in a.txt  "
+        stat = self.scheduler._parse_job_line(line)
+        self.assertEqual(stat['id'], '123456')
+        self.assertEqual(stat['state'], 'running')
+        self.assertEqual(stat['project'], 'myproj')
+        self.assertEqual(stat['command'], '/bin/app --in a.txt')
+        self.assertEqual(stat['time_remaining_sec'], 47*3600 + 59*60 + 30)
+        self.assertEqual(stat['time_remaining_min'], 47*60 + 59)
+        self.assertEqual(stat['wall_time_sec'], 48*3600)
+        self.assertEqual(stat['wall_time_min'], 48*60)
+
+    def test_parse_job_line_no_times(self):
+        line = "123457  N/A  00:30:00  queued  debug  2  myproj  job.sh"
+        stat = self.scheduler._parse_job_line(line)
+        self.assertNotIn('time_remaining_sec', stat)
+        self.assertEqual(stat['wall_time_min'], 30)
+
+    def test_parse_job_line_short(self):
+        self.assertEqual(self.scheduler._parse_job_line("123458  00:10:00"), {})
+
+    def test_parse_status_output(self):
+        '''Both header lines are skipped'''
+        raw_output = (
+            "JobID  TimeRemaining  WallTime  State  Queue  Nodes  Project  Command\n"
+            "=======================================================================\n"
+            "123456  47:59:30  48:00:00  running  default  128  myproj  /bin/app --in a.txt\n"
+            "123457  N/A  00:30:00  queued  debug  2  myproj  job.sh\n"
+        )
+        statuses = self.scheduler._parse_status_output(raw_output)
+        self.assertEqual(sorted(statuses), [123456, 123457])
+        self.assertEqual(statuses[123456]['command'], '/bin/app --in a.txt')
+
+    def test_missing_status_exe(self):
+        '''A missing qstat is reported like a failed status command'''
+        self.scheduler.QSTAT_EXE = '/nonexistent/bin/qstat'
+        with self.assertRaises(StatusNonZeroReturnCode):
+            self.scheduler.status_dict()
+        with self.assertRaises(NoQStatInformation):
+            self.scheduler.get_status(123456)
+
+
+class SubmitOutputTests(unittest.TestCase):
+    def test_parse_submit_output(self):
+        '''The job id is the last token of the submit output'''
+        self.assertEqual(CobaltScheduler()._parse_submit_output("123456\n"), 123456)
+        self.assertEqual(
+            SlurmScheduler()._parse_submit_output("Submitted batch job 4242\n"), 4242)
@@ -0,0 +1,114 @@
+import glob
+import json
+import os
+import tempfile
+import unittest
+from uuid import uuid4
+
+from balsam.core.transitions import fast_forward, match_workdir_files
+from tests.BalsamTestCase import BalsamTestCase, create_job
+
+
+class MatchWorkdirFilesTests(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.work_dir = self.tempdir.name
+        names = ['a.out', 'b.out', 'result.dat', '.hidden.out', '.balsam.log']
+        for name in names:
+            open(os.path.join(self.work_dir, name), 'w').close()
+        os.mkdir(os.path.join(self.work_dir, 'sub'))
+        open(os.path.join(self.work_dir, 'sub', 'c.out'), 'w').close()
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def glob_all(self, patterns):
+        matches = []
+        for pattern in patterns:
+            matches.extend(glob.glob(os.path.join(self.work_dir, pattern)))
+        return matches
+
+    def assertMatchesGlob(self, patterns):
+        matches = match_workdir_files(self.work_dir, patterns)
+        self.assertEqual(sorted(matches), sorted(self.glob_all(patterns)))
+        return matches
+
+    def test_same_as_glob(self):
+        '''Simple patterns match the same files as glob'''
+        matches = self.assertMatchesGlob(['*.out', 'result.dat', 'missing.txt'])
+        names = sorted(os.path.basename(f) for f in matches)
+        self.assertEqual(names, ['a.out', 'b.out', 'result.dat'])
+
+    def test_hidden_files(self):
+        '''Like glob, wildcards only match dotfiles if the pattern starts with a dot'''
+        matches = self.assertMatchesGlob(['*'])
+        self.assertNotIn('.hidden.out', map(os.path.basename, matches))
+
+        matches = self.assertMatchesGlob(['.*'])
+        names = sorted(os.path.basename(f) for f in matches)
+        self.assertEqual(names, ['.balsam.log', '.hidden.out'])
+
+    def test_subdirectory_pattern(self):
+        '''Patterns containing a path separator fall back to glob'''
+        matches = self.assertMatchesGlob(['*.out', os.path.join('sub', '*.out')])
+        self.assertIn(os.path.join(self.work_dir, 'sub', 'c.out'), matches)
+
+    def test_missing_workdir(self):
+        missing = os.path.join(self.work_dir, 'missing')
+        self.assertEqual(match_workdir_files(missing, ['*']), [])
+
+
+class FastForwardParentsTests(BalsamTestCase):
+    def setUp(self):
+        self.finished = create_job(name='finished', state='JOB_FINISHED')
+        self.failed = create_job(name='failed', state='FAILED')
+        self.running = create_job(name='running', state='RUNNING')
+
+    def child(self, name, parents, state='CREATED'):
+        job = create_job(name=name, state=state)
+        job.set_parents(parents)
+        return job
+
+    def test_parents_finished(self):
+        '''Children of finished parents skip straight to PREPROCESSED'''
+        child = self.child('child', [self.finished])
+        orphan = create_job(name='orphan')
+        fast_forward([child, orphan])
+        self.assertEqual(child.state, 'PREPROCESSED')
+        self.assertEqual(orphan.state, 'PREPROCESSED')
+
+    def test_parents_not_finished(self):
+        '''A child waits while any parent is unfinished or missing'''
+        waiting = self.child('waiting', [self.finished, self.running])
+        missing = create_job(name='missing')
+        missing.parents = json.dumps([str(self.finished.pk), str(uuid4())])
+        missing.save()
+        jobs = [waiting, missing]
+
+        fast_forward(jobs)
+        self.assertEqual([j.state for j in jobs], ['AWAITING_PARENTS']*2)
+        # A second pass leaves them waiting: neither parent has failed
+        fast_forward(jobs)
+        self.assertEqual([j.state for j in jobs], ['AWAITING_PARENTS']*2)
+
+    def test_parent_failed(self):
+        '''A waiting child fails once any of its parents has failed'''
+        child = self.child('child', [self.finished, self.failed], state='AWAITING_PARENTS')
+        fast_forward([child])
+        self.assertEqual(child.state, 'FAILED')
+
+    def test_parent_finishes(self):
+        '''A waiting child is released once its last parent finishes'''
+        child = self.child('child', [self.finished, self.running])
+        fast_forward([child])
+        self.assertEqual(child.state, 'AWAITING_PARENTS')
+
+        self.running.update_state('JOB_FINISHED')
+        fast_forward([child])
+        self.assertEqual(child.state, 'PREPROCESSED')
+
+    def test_no_wait_for_parents(self):
+        child = self.child('child', [self.running])
+        child.wait_for_parents = False
+        fast_forward([child])
+        self.assertEqual(child.state, 'PREPROCESSED')